@@ -11,13 +11,8 @@ from idb.common.types import IdbClient
 
 
 class AccessibilityInfoAllCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Describes Accessibility Information for the entire screen"
-
-    @property
-    def name(self) -> str:
-        return "describe-all"
+    description = "Describes Accessibility Information for the entire screen"
+    name = "describe-all"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         super().add_parser_arguments(parser)
@@ -34,13 +29,8 @@ class AccessibilityInfoAllCommand(ClientCommand):
 
 
 class AccessibilityInfoAtPointCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Describes Accessibility Information at a point on the screen"
-
-    @property
-    def name(self) -> str:
-        return "describe-point"
+    description = "Describes Accessibility Information at a point on the screen"
+    name = "describe-point"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         super().add_parser_arguments(parser)
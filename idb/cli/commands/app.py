@@ -18,13 +18,8 @@ from idb.utils.typing import none_throws
 
 
 class AppInstallCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Install an application"
-
-    @property
-    def name(self) -> str:
-        return "install"
+    description = "Install an application"
+    name = "install"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
@@ -56,13 +51,8 @@ class AppInstallCommand(ClientCommand):
 
 
 class AppUninstallCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Uninstall an application"
-
-    @property
-    def name(self) -> str:
-        return "uninstall"
+    description = "Uninstall an application"
+    name = "uninstall"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
@@ -75,13 +65,8 @@ class AppUninstallCommand(ClientCommand):
 
 
 class AppTerminateCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Terminate a running application"
-
-    @property
-    def name(self) -> str:
-        return "terminate"
+    description = "Terminate a running application"
+    name = "terminate"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("bundle_id", help="Bundle id of the app to kill", type=str)
@@ -92,13 +77,8 @@ class AppTerminateCommand(ClientCommand):
 
 
 class AppListCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "List the installed apps"
-
-    @property
-    def name(self) -> str:
-        return "list-apps"
+    description = "List the installed apps"
+    name = "list-apps"
 
     async def run_with_client(self, args: Namespace, client: IdbClient) -> None:
         apps = await client.list_apps()
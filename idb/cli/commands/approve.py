@@ -17,13 +17,8 @@ _ARG_TO_ENUM: Dict[str, Permission] = {
 
 
 class ApproveCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Approve permissions for an app"
-
-    @property
-    def name(self) -> str:
-        return "approve"
+    description = "Approve permissions for an app"
+    name = "approve"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("bundle_id", help="App's bundle id", type=str)
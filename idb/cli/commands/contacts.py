@@ -11,13 +11,8 @@ from idb.common.types import IdbClient
 
 
 class ContactsUpdateCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Updates the contacts"
-
-    @property
-    def name(self) -> str:
-        return "update"
+    description = "Updates the contacts"
+    name = "update"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
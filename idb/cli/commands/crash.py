@@ -53,13 +53,8 @@ def _build_query(arguments: Namespace) -> CrashLogQuery:
 
 
 class CrashListCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "List the available crashes"
-
-    @property
-    def name(self) -> str:
-        return "list"
+    description = "List the available crashes"
+    name = "list"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         _add_query_arguments(parser=parser)
@@ -72,13 +67,8 @@ class CrashListCommand(ClientCommand):
 
 
 class CrashShowCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Fetch a crash log"
-
-    @property
-    def name(self) -> str:
-        return "show"
+    description = "Fetch a crash log"
+    name = "show"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("name", help="The unique name of the crash")
@@ -90,13 +80,8 @@ class CrashShowCommand(ClientCommand):
 
 
 class CrashDeleteCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Delete a crash log"
-
-    @property
-    def name(self) -> str:
-        return "delete"
+    description = "Delete a crash log"
+    name = "delete"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
@@ -21,13 +21,8 @@ from idb.common.types import IdbException
 
 
 class DaemonCommand(BaseCommand):
-    @property
-    def description(self) -> str:
-        return "This command is deprecated. the idb daemon is not used anymore."
-
-    @property
-    def name(self) -> str:
-        return "daemon"
+    description = "This command is deprecated. the idb daemon is not used anymore."
+    name = "daemon"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
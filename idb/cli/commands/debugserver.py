@@ -11,13 +11,8 @@ from idb.common.types import IdbClient
 
 
 class DebugServerStartCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Start the Debug Server"
-
-    @property
-    def name(self) -> str:
-        return "start"
+    description = "Start the Debug Server"
+    name = "start"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         super().add_parser_arguments(parser)
@@ -29,26 +24,16 @@ class DebugServerStartCommand(ClientCommand):
 
 
 class DebugServerStopCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Stop the debug server"
-
-    @property
-    def name(self) -> str:
-        return "stop"
+    description = "Stop the debug server"
+    name = "stop"
 
     async def run_with_client(self, args: Namespace, client: IdbClient) -> None:
         await client.debugserver_stop()
 
 
 class DebugServerStatusCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Get the status of the debug server"
-
-    @property
-    def name(self) -> str:
-        return "status"
+    description = "Get the status of the debug server"
+    name = "status"
 
     async def run_with_client(self, args: Namespace, client: IdbClient) -> None:
         commands = await client.debugserver_status()
@@ -12,13 +12,8 @@ from idb.common.types import IdbClient
 
 
 class DsymInstallCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Install dSYM(s)"
-
-    @property
-    def name(self) -> str:
-        return "install"
+    description = "Install dSYM(s)"
+    name = "install"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("dsym_path", help="Path to dSYM(s) to install", type=str)
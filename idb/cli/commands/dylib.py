@@ -12,13 +12,8 @@ from idb.common.types import IdbClient
 
 
 class DylibInstallCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Install an dylib"
-
-    @property
-    def name(self) -> str:
-        return "install"
+    description = "Install an dylib"
+    name = "install"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("dylib_path", help="Path to the dylib to install", type=str)
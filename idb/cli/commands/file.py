@@ -4,15 +4,14 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
+import functools
 import json
 import os
 import sys
-import tempfile
 from abc import abstractmethod
 from argparse import ArgumentParser, Namespace
-from typing import Any, List, NamedTuple, Optional, Tuple
+from typing import NamedTuple, Optional, Tuple
 
-import aiofiles
 from idb.cli import ClientCommand
 from idb.common.types import FileContainer, FileContainerType, IdbClient
 
@@ -21,47 +20,34 @@ class BundleWithPath(NamedTuple):
     bundle_id: Optional[str]
     path: str
 
+    # Results are immutable, so repeated arguments can share a parsed value
     @classmethod
+    @functools.lru_cache(maxsize=256)
     def parse(cls, argument: str) -> "BundleWithPath":
-        split = argument.split(sep=":", maxsplit=1)
-        if len(split) == 1:
-            return BundleWithPath(bundle_id=None, path=split[0])
-        return BundleWithPath(bundle_id=split[0], path=split[1])
-
-
-def _extract_bundle_id(args: Namespace) -> FileContainer:
-    if args.bundle_id is not None:
-        return args.bundle_id
-    values = []
-    for value in vars(args).values():
-        if isinstance(value, List):
-            values.extend(value)
-        else:
-            values.append(value)
-    for value in values:
-        if not isinstance(value, BundleWithPath):
-            continue
-        bundle_id = value.bundle_id
-        if bundle_id is None:
-            continue
-        args.bundle_id = bundle_id
-    return args.bundle_id
+        (head, separator, tail) = argument.partition(":")
+        # Positional construction skips NamedTuple's keyword argument handling
+        if not separator:
+            return cls(None, head)
+        return cls(head, tail)
 
 
 def _convert_args(args: Namespace) -> Tuple[Namespace, FileContainer]:
-    def convert_value(value: Any) -> Any:  # pyre-ignore
-        if isinstance(value, List):
-            return [convert_value(x) for x in value]
-        return value.path if isinstance(value, BundleWithPath) else value
-
-    bundle_id = _extract_bundle_id(args)
-    args = Namespace(
-        **{
-            key: convert_value(value)
-            for (key, value) in vars(args).items()
-            if key != "bundle_id"
-        }
-    )
+    # Converts BundleWithPath values to their paths in place, picking up the first
+    # bundle id along the way if one wasn't provided with --bundle-id. Lists that
+    # argparse built for nargs are updated in place too, rather than copied.
+    bundle_id = args.bundle_id
+    for (key, value) in vars(args).items():
+        if isinstance(value, BundleWithPath):
+            if bundle_id is None:
+                bundle_id = value.bundle_id
+            setattr(args, key, value.path)
+        elif isinstance(value, list):
+            for (index, item) in enumerate(value):
+                if isinstance(item, BundleWithPath):
+                    if bundle_id is None:
+                        bundle_id = item.bundle_id
+                    value[index] = item.path
+    delattr(args, "bundle_id")
     file_container = bundle_id or args.container_type
     return (args, file_container)
 
@@ -120,17 +106,9 @@ class FSCommand(ClientCommand):
 
 
 class FSListCommand(FSCommand):
-    @property
-    def description(self) -> str:
-        return "List a path inside an application's container"
-
-    @property
-    def name(self) -> str:
-        return "list"
-
-    @property
-    def aliases(self) -> List[str]:
-        return ["ls"]
+    description = "List a path inside an application's container"
+    name = "list"
+    aliases = ["ls"]
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
@@ -170,19 +148,13 @@ class FSListCommand(FSCommand):
             paths = await client.ls_single(container=container, path=args.paths[0])
             if args.json:
                 print(json.dumps([{"path": item.path} for item in paths]))
-            else:
-                for item in paths:
-                    print(item.path)
+            elif len(paths):
+                print("\n".join(item.path for item in paths))
 
 
 class FSMkdirCommand(FSCommand):
-    @property
-    def description(self) -> str:
-        return "Make a directory inside an application's container"
-
-    @property
-    def name(self) -> str:
-        return "mkdir"
+    description = "Make a directory inside an application's container"
+    name = "mkdir"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         super().add_parser_arguments(parser)
@@ -197,17 +169,9 @@ class FSMkdirCommand(FSCommand):
 
 
 class FSMoveCommand(FSCommand):
-    @property
-    def description(self) -> str:
-        return "Move a path inside an application's container"
-
-    @property
-    def name(self) -> str:
-        return "move"
-
-    @property
-    def aliases(self) -> List[str]:
-        return ["mv"]
+    description = "Move a path inside an application's container"
+    name = "move"
+    aliases = ["mv"]
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
@@ -230,17 +194,9 @@ class FSMoveCommand(FSCommand):
 
 
 class FSRemoveCommand(FSCommand):
-    @property
-    def description(self) -> str:
-        return "Remove an item inside a container"
-
-    @property
-    def name(self) -> str:
-        return "remove"
-
-    @property
-    def aliases(self) -> List[str]:
-        return ["rm"]
+    description = "Remove an item inside a container"
+    name = "remove"
+    aliases = ["rm"]
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
@@ -258,13 +214,8 @@ class FSRemoveCommand(FSCommand):
 
 
 class FSPushCommand(FSCommand):
-    @property
-    def description(self) -> str:
-        return "Copy file(s) from local machine to target"
-
-    @property
-    def name(self) -> str:
-        return "push"
+    description = "Copy file(s) from local machine to target"
+    name = "push"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
@@ -283,21 +234,20 @@ class FSPushCommand(FSCommand):
     async def run_with_container(
         self, container: FileContainer, args: Namespace, client: IdbClient
     ) -> None:
+        # Equivalent to os.path.abspath, without a getcwd call per path
+        cwd = os.getcwd()
         return await client.push(
             container=container,
-            src_paths=[os.path.abspath(path) for path in args.src_paths],
+            src_paths=[
+                os.path.normpath(os.path.join(cwd, path)) for path in args.src_paths
+            ],
             dest_path=args.dest_path,
         )
 
 
 class FSPullCommand(FSCommand):
-    @property
-    def description(self) -> str:
-        return "Copy a file inside an application's container"
-
-    @property
-    def name(self) -> str:
-        return "pull"
+    description = "Copy a file inside an application's container"
+    name = "pull"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
@@ -315,13 +265,8 @@ class FSPullCommand(FSCommand):
 
 
 class FSShowCommand(FSCommand):
-    @property
-    def description(self) -> str:
-        return "Write the contents of a remote file to stdout"
-
-    @property
-    def name(self) -> str:
-        return "show"
+    description = "Write the contents of a remote file to stdout"
+    name = "show"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
@@ -332,15 +277,5 @@ class FSShowCommand(FSCommand):
     async def run_with_container(
         self, container: FileContainer, args: Namespace, client: IdbClient
     ) -> None:
-        with tempfile.TemporaryDirectory() as destination_directory:
-            # Remove the tempfile so that it can be written to.
-            destination_directory = os.path.abspath(destination_directory)
-            destination_file = os.path.join(
-                destination_directory, os.path.basename(args.src)
-            )
-            await client.pull(
-                container=container, src_path=args.src, dest_path=destination_directory
-            )
-            async with aiofiles.open(destination_file, "rb") as f:
-                data = await f.read()
-                sys.stdout.buffer.write(data)
+        async for data in client.pull_stream(container=container, src_path=args.src):
+            sys.stdout.buffer.write(data)
@@ -11,13 +11,8 @@ from idb.common.types import IdbClient
 
 
 class FocusCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Brings the simulator window to front"
-
-    @property
-    def name(self) -> str:
-        return "focus"
+    description = "Brings the simulator window to front"
+    name = "focus"
 
     async def run_with_client(self, args: Namespace, client: IdbClient) -> None:
         await client.focus()
@@ -12,13 +12,8 @@ from idb.common.types import IdbClient
 
 
 class FrameworkInstallCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Install .Framework bundles"
-
-    @property
-    def name(self) -> str:
-        return "install"
+    description = "Install .Framework bundles"
+    name = "install"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
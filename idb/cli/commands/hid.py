@@ -11,13 +11,8 @@ from idb.common.types import HIDButtonType, IdbClient
 
 
 class TapCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Tap On the Screen"
-
-    @property
-    def name(self) -> str:
-        return "tap"
+    description = "Tap On the Screen"
+    name = "tap"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("x", help="The x-coordinate", type=int)
@@ -30,13 +25,8 @@ class TapCommand(ClientCommand):
 
 
 class ButtonCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "A single press of a button"
-
-    @property
-    def name(self) -> str:
-        return "button"
+    description = "A single press of a button"
+    name = "button"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
@@ -55,13 +45,8 @@ class ButtonCommand(ClientCommand):
 
 
 class KeyCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "A short press of a keycode"
-
-    @property
-    def name(self) -> str:
-        return "key"
+    description = "A short press of a keycode"
+    name = "key"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("key", help="The key code", type=int)
@@ -73,13 +58,8 @@ class KeyCommand(ClientCommand):
 
 
 class KeySequenceCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "A sequence of short presses of a keycode"
-
-    @property
-    def name(self) -> str:
-        return "key-sequence"
+    description = "A sequence of short presses of a keycode"
+    name = "key-sequence"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
@@ -94,13 +74,8 @@ class KeySequenceCommand(ClientCommand):
 
 
 class TextCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Input text"
-
-    @property
-    def name(self) -> str:
-        return "text"
+    description = "Input text"
+    name = "text"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("text", help="Text to input", type=str)
@@ -111,13 +86,8 @@ class TextCommand(ClientCommand):
 
 
 class SwipeCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Swipe from one point to another point"
-
-    @property
-    def name(self) -> str:
-        return "swipe"
+    description = "Swipe from one point to another point"
+    name = "swipe"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
@@ -15,13 +15,8 @@ from idb.common.types import IdbClient, InstrumentsTimings
 
 
 class InstrumentsCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Run instruments on the device"
-
-    @property
-    def name(self) -> str:
-        return "instruments"
+    description = "Run instruments on the device"
+    name = "instruments"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
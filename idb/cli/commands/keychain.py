@@ -11,13 +11,8 @@ from idb.common.types import IdbClient
 
 
 class KeychainClearCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Clear the targets keychain"
-
-    @property
-    def name(self) -> str:
-        return "clear-keychain"
+    description = "Clear the targets keychain"
+    name = "clear-keychain"
 
     async def run_with_client(self, args: Namespace, client: IdbClient) -> None:
         await client.clear_keychain()
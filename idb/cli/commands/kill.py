@@ -11,13 +11,8 @@ from idb.common.types import IdbManagementClient
 
 
 class KillCommand(ManagementCommand):
-    @property
-    def description(self) -> str:
-        return "Kill the idb daemon"
-
-    @property
-    def name(self) -> str:
-        return "kill"
+    description = "Kill the idb daemon"
+    name = "kill"
 
     async def run_with_client(
         self, args: Namespace, client: IdbManagementClient
@@ -13,16 +13,11 @@ from idb.common.types import IdbClient
 
 
 class LaunchCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return (
-            "Launch an application. Any environment variables of the form IDB_X\n"
-            " will be passed through with the IDB_ prefix removed."
-        )
-
-    @property
-    def name(self) -> str:
-        return "launch"
+    description = (
+        "Launch an application. Any environment variables of the form IDB_X\n"
+        " will be passed through with the IDB_ prefix removed."
+    )
+    name = "launch"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
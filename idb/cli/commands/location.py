@@ -11,13 +11,8 @@ from idb.common.types import IdbClient
 
 
 class LocationSetCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Set a simulator's location"
-
-    @property
-    def name(self) -> str:
-        return "set-location"
+    description = "Set a simulator's location"
+    name = "set-location"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("latitude", help="Latitude to set", type=float)
@@ -13,13 +13,8 @@ from idb.common.types import IdbClient
 
 
 class LogCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Obtain logs from the target"
-
-    @property
-    def name(self) -> str:
-        return "log"
+    description = "Obtain logs from the target"
+    name = "log"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
@@ -67,13 +62,8 @@ log stream --predicate examples:
 
 
 class CompanionLogCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Obtain logs from the companion"
-
-    @property
-    def name(self) -> str:
-        return "log"
+    description = "Obtain logs from the companion"
+    name = "log"
 
     async def run_with_client(self, args: Namespace, client: IdbClient) -> None:
         async for chunk in client.tail_companion_logs(stop=signal_handler_event("log")):
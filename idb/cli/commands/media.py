@@ -11,13 +11,8 @@ from idb.common.types import IdbClient
 
 
 class MediaAddCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Add photos/videos to the target"
-
-    @property
-    def name(self) -> str:
-        return "add-media"
+    description = "Add photos/videos to the target"
+    name = "add-media"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
@@ -14,13 +14,8 @@ from idb.common.types import IdbClient
 
 
 class ScreenshotCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Take a Screenshot of the Target"
-
-    @property
-    def name(self) -> str:
-        return "screenshot"
+    description = "Take a Screenshot of the Target"
+    name = "screenshot"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
@@ -16,13 +16,8 @@ _DISABLE = "disable"
 
 
 class HardwareKeyboardCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Set the hardware keyboard"
-
-    @property
-    def name(self) -> str:
-        return "hardware-keyboard"
+    description = "Set the hardware keyboard"
+    name = "hardware-keyboard"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
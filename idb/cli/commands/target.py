@@ -6,7 +6,9 @@
 
 import json
 from argparse import SUPPRESS, ArgumentParser, Namespace
-from typing import Union
+from logging import Logger
+from operator import attrgetter
+from typing import Dict, Union
 
 import idb.common.plugin as plugin
 from idb.cli import ClientCommand, CompanionCommand, ManagementCommand
@@ -40,14 +42,17 @@ def get_destination(args: Namespace) -> Union[TCPAddress, str]:
         )
 
 
-class TargetConnectCommand(ManagementCommand):
-    @property
-    def description(self) -> str:
-        return "Connect to a companion"
+def _resolve_string_metadata(logger: Logger) -> Dict[str, str]:
+    return {
+        key: value
+        for (key, value) in plugin.resolve_metadata(logger).items()
+        if isinstance(value, str)
+    }
+
 
-    @property
-    def name(self) -> str:
-        return "connect"
+class TargetConnectCommand(ManagementCommand):
+    description = "Connect to a companion"
+    name = "connect"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
@@ -75,11 +80,7 @@ class TargetConnectCommand(ManagementCommand):
             destination = get_destination(args=args)
             response = await client.connect(
                 destination=destination,
-                metadata={
-                    key: value
-                    for (key, value) in plugin.resolve_metadata(self.logger).items()
-                    if isinstance(value, str)
-                },
+                metadata=_resolve_string_metadata(self.logger),
             )
             if args.json:
                 print(
@@ -102,13 +103,8 @@ class TargetConnectCommand(ManagementCommand):
 
 
 class TargetDisconnectCommand(ManagementCommand):
-    @property
-    def description(self) -> str:
-        return "Disconnect a companion"
-
-    @property
-    def name(self) -> str:
-        return "disconnect"
+    description = "Disconnect a companion"
+    name = "disconnect"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
@@ -138,13 +134,8 @@ class TargetDisconnectCommand(ManagementCommand):
 
 
 class TargetDescribeCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Describes the Target"
-
-    @property
-    def name(self) -> str:
-        return "describe"
+    description = "Describes the Target"
+    name = "describe"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
@@ -164,13 +155,8 @@ class TargetDescribeCommand(ClientCommand):
 
 
 class TargetListCommand(ManagementCommand):
-    @property
-    def description(self) -> str:
-        return "List the connected targets"
-
-    @property
-    def name(self) -> str:
-        return "list-targets"
+    description = "List the connected targets"
+    name = "list-targets"
 
     async def run_with_client(
         self, args: Namespace, client: IdbManagementClient
@@ -181,28 +167,22 @@ class TargetListCommand(ManagementCommand):
                 print("No available targets")
             return
 
-        targets = sorted(targets, key=lambda target: target.name)
+        targets = sorted(targets, key=attrgetter("name"))
         formatter = human_format_target_info
         if args.json:
             formatter = json_format_target_info
-        for target in targets:
-            print(formatter(target))
+        print("\n".join(formatter(target) for target in targets))
 
 
 class TargetCreateCommand(CompanionCommand):
+    description = "Creates an iOS Simulator"
+    name = "create"
+
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("device_type", help="The Device Type to create", type=str)
         parser.add_argument("os_version", help="The OS Version to create", type=str)
         super().add_parser_arguments(parser)
 
-    @property
-    def description(self) -> str:
-        return "Creates an iOS Simulator"
-
-    @property
-    def name(self) -> str:
-        return "create"
-
     async def run_with_companion(self, args: Namespace, companion: Companion) -> None:
         target = await companion.create(
             device_type=args.device_type, os_version=args.os_version
@@ -225,6 +205,9 @@ class UDIDTargetedCompanionCommand(CompanionCommand):
 
 
 class TargetBootCommand(UDIDTargetedCompanionCommand):
+    description = "Boots a simulator (only works on mac)"
+    name = "boot"
+
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         super().add_parser_arguments(parser)
         parser.add_argument(
@@ -236,14 +219,6 @@ class TargetBootCommand(UDIDTargetedCompanionCommand):
             action="store_true",
         )
 
-    @property
-    def description(self) -> str:
-        return "Boots a simulator (only works on mac)"
-
-    @property
-    def name(self) -> str:
-        return "boot"
-
     async def run_with_companion(self, args: Namespace, companion: Companion) -> None:
         if args.headless:
             async with companion.boot_headless(udid=self.get_udid(args)):
@@ -253,39 +228,24 @@ class TargetBootCommand(UDIDTargetedCompanionCommand):
 
 
 class TargetShutdownCommand(UDIDTargetedCompanionCommand):
-    @property
-    def description(self) -> str:
-        return "Shuts the simulator down (only works on mac)"
-
-    @property
-    def name(self) -> str:
-        return "shutdown"
+    description = "Shuts the simulator down (only works on mac)"
+    name = "shutdown"
 
     async def run_with_companion(self, args: Namespace, companion: Companion) -> None:
         await companion.shutdown(udid=self.get_udid(args))
 
 
 class TargetEraseCommand(UDIDTargetedCompanionCommand):
-    @property
-    def description(self) -> str:
-        return "Erases the simulator (only works on mac)"
-
-    @property
-    def name(self) -> str:
-        return "erase"
+    description = "Erases the simulator (only works on mac)"
+    name = "erase"
 
     async def run_with_companion(self, args: Namespace, companion: Companion) -> None:
         await companion.erase(udid=self.get_udid(args))
 
 
 class TargetCloneCommand(UDIDTargetedCompanionCommand):
-    @property
-    def description(self) -> str:
-        return "Erases the simulator (only works on mac)"
-
-    @property
-    def name(self) -> str:
-        return "clone"
+    description = "Erases the simulator (only works on mac)"
+    name = "clone"
 
     async def run_with_companion(self, args: Namespace, companion: Companion) -> None:
         target = await companion.clone(udid=self.get_udid(args))
@@ -293,26 +253,16 @@ class TargetCloneCommand(UDIDTargetedCompanionCommand):
 
 
 class TargetDeleteCommand(UDIDTargetedCompanionCommand):
-    @property
-    def description(self) -> str:
-        return "Deletes (only works on mac)"
-
-    @property
-    def name(self) -> str:
-        return "delete"
+    description = "Deletes (only works on mac)"
+    name = "delete"
 
     async def run_with_companion(self, args: Namespace, companion: Companion) -> None:
         await companion.delete(udid=self.get_udid(args))
 
 
 class TargetDeleteAllCommand(CompanionCommand):
-    @property
-    def description(self) -> str:
-        return "Deletes all simulators (only works on mac)"
-
-    @property
-    def name(self) -> str:
-        return "delete-all"
+    description = "Deletes all simulators (only works on mac)"
+    name = "delete-all"
 
     async def run_with_companion(self, args: Namespace, companion: Companion) -> None:
         await companion.delete(udid=None)
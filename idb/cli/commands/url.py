@@ -11,13 +11,8 @@ from idb.common.types import IdbClient
 
 
 class UrlOpenCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Open a URL"
-
-    @property
-    def name(self) -> str:
-        return "open"
+    description = "Open a URL"
+    name = "open"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("url", help="URL to launch", type=str)
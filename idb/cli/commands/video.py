@@ -4,9 +4,12 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
+import asyncio
+import os
 import sys
 from argparse import ArgumentParser, Namespace
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 from idb.cli import ClientCommand
 from idb.common.signal import signal_handler_event, signal_handler_generator
@@ -14,22 +17,86 @@ from idb.common.types import IdbClient, VideoFormat
 
 
 _FORMAT_CHOICE_MAP: Dict[str, VideoFormat] = {
-    str(format.value.lower()): format for format in VideoFormat
+    format.value.lower(): format for format in VideoFormat
 }
+_FORMAT_CHOICES: Tuple[str, ...] = tuple(_FORMAT_CHOICE_MAP)
 
 
-class VideoRecordCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Record the target's screen to a mp4 video file"
+_WRITE_BATCH_BYTES: int = 64 * 1024
+_WRITE_BATCH_COUNT: int = 16
+
+
+def _writev_all(fd: int, buffers: List[bytes]) -> None:
+    # os.writev can be partial when writing to a pipe
+    views = [memoryview(buffer) for buffer in buffers]
+    while views:
+        written = os.writev(fd, views)
+        while views and written >= len(views[0]):
+            written -= len(views.pop(0))
+        if written:
+            views[0] = views[0][written:]
+
+
+class _BatchedWriter:
+    # Writes to the fd on a single executor thread. Chunks that arrive whilst a
+    # write is in flight are batched into the next writev, so there is no added
+    # latency when the consumer keeps up.
+    def __init__(
+        self, fd: int, loop: asyncio.AbstractEventLoop, executor: ThreadPoolExecutor
+    ) -> None:
+        self._fd = fd
+        self._loop = loop
+        self._executor = executor
+        self._pending: List[bytes] = []
+        self._pending_size = 0
+        self._write: Optional["asyncio.Future[None]"] = None
+
+    def _flush(self) -> None:
+        buffers = self._pending
+        self._pending = []
+        self._pending_size = 0
+        write = self._loop.run_in_executor(
+            self._executor, _writev_all, self._fd, buffers
+        )
+        write.add_done_callback(self._on_written)
+        self._write = write
 
-    @property
-    def name(self) -> str:
-        return "video"
+    def _on_written(self, write: "asyncio.Future[None]") -> None:
+        if write is not self._write or write.cancelled() or write.exception():
+            return
+        if self._pending:
+            self._flush()
 
-    @property
-    def aliases(self) -> List[str]:
-        return ["record-video"]
+    async def write(self, data: bytes) -> None:
+        self._pending.append(data)
+        self._pending_size += len(data)
+        write = self._write
+        if write is None or write.done():
+            if write is not None:
+                write.result()
+            self._flush()
+        elif (
+            self._pending_size >= _WRITE_BATCH_BYTES
+            or len(self._pending) >= _WRITE_BATCH_COUNT
+        ):
+            await write
+
+    async def close(self) -> None:
+        while True:
+            write = self._write
+            if write is not None:
+                await write
+            if write is not self._write:
+                continue
+            if not self._pending:
+                return
+            self._flush()
+
+
+class VideoRecordCommand(ClientCommand):
+    description = "Record the target's screen to a mp4 video file"
+    name = "video"
+    aliases = ["record-video"]
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("output_file", help="mp4 file to output the video to")
@@ -42,13 +109,8 @@ class VideoRecordCommand(ClientCommand):
 
 
 class VideoStreamCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Stream raw H264 from the target"
-
-    @property
-    def name(self) -> str:
-        return "video-stream"
+    description = "Stream raw H264 from the target"
+    name = "video-stream"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
@@ -60,7 +122,7 @@ class VideoStreamCommand(ClientCommand):
         )
         parser.add_argument(
             "--format",
-            choices=list(_FORMAT_CHOICE_MAP.keys()),
+            choices=_FORMAT_CHOICES,
             help="The format of the stream",
             default=VideoFormat.H264.value,
         )
@@ -73,13 +135,23 @@ class VideoStreamCommand(ClientCommand):
         super().add_parser_arguments(parser)
 
     async def run_with_client(self, args: Namespace, client: IdbClient) -> None:
-        async for data in signal_handler_generator(
-            iterable=client.stream_video(
-                output_file=args.output_file,
-                fps=args.fps,
-                format=_FORMAT_CHOICE_MAP[args.format],
-            ),
-            name="stream",
-            logger=self.logger,
-        ):
-            sys.stdout.buffer.write(data)
+        # Bypass the buffered writer for the raw stream, flushing anything already
+        # written to it so that the output is not interleaved.
+        sys.stdout.flush()
+        fd = sys.stdout.fileno()
+        loop = asyncio.get_event_loop()
+        # Writes happen on a single thread, so that a slow consumer of stdout doesn't
+        # block the event loop from reading the next chunk.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            writer = _BatchedWriter(fd=fd, loop=loop, executor=executor)
+            async for data in signal_handler_generator(
+                iterable=client.stream_video(
+                    output_file=args.output_file,
+                    fps=args.fps,
+                    format=_FORMAT_CHOICE_MAP[args.format],
+                ),
+                name="stream",
+                logger=self.logger,
+            ):
+                await writer.write(data)
+            await writer.close()
@@ -21,13 +21,8 @@ from idb.common.types import IdbClient
 
 
 class XctestInstallCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "Install an xctest"
-
-    @property
-    def name(self) -> str:
-        return "install"
+    description = "Install an xctest"
+    name = "install"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
@@ -53,13 +48,8 @@ class XctestInstallCommand(ClientCommand):
 
 
 class XctestsListBundlesCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "List the installed test bundles"
-
-    @property
-    def name(self) -> str:
-        return "list"
+    description = "List the installed test bundles"
+    name = "list"
 
     async def run_with_client(self, args: Namespace, client: IdbClient) -> None:
         tests = await client.list_xctests()
@@ -71,13 +61,8 @@ class XctestsListBundlesCommand(ClientCommand):
 
 
 class XctestListTestsCommand(ClientCommand):
-    @property
-    def description(self) -> str:
-        return "List the tests inside an installed test bundle"
-
-    @property
-    def name(self) -> str:
-        return "list-bundle"
+    description = "List the tests inside an installed test bundle"
+    name = "list-bundle"
 
     def add_parser_positional_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument(
@@ -217,9 +202,7 @@ class CommonRunXcTestCommand(ClientCommand):
 
 
 class XctestRunAppCommand(CommonRunXcTestCommand):
-    @property
-    def name(self) -> str:
-        return "app"
+    name = "app"
 
     def add_parser_positional_arguments(self, parser: ArgumentParser) -> None:
         super().add_parser_positional_arguments(parser)
@@ -263,9 +246,7 @@ class XctestRunAppCommand(CommonRunXcTestCommand):
 
 
 class XctestRunUICommand(XctestRunAppCommand):
-    @property
-    def name(self) -> str:
-        return "ui"
+    name = "ui"
 
     def add_parser_positional_arguments(self, parser: ArgumentParser) -> None:
         super().add_parser_positional_arguments(parser)
@@ -282,9 +263,7 @@ class XctestRunUICommand(XctestRunAppCommand):
 
 
 class XctestRunLogicCommand(CommonRunXcTestCommand):
-    @property
-    def name(self) -> str:
-        return "logic"
+    name = "logic"
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         super().add_parser_arguments(parser)
@@ -318,6 +297,12 @@ class XctestRunLogicCommand(CommonRunXcTestCommand):
 
 
 class XctestRunCommand(CompositeCommand):
+    description = (
+        "Run an installed xctest. Any environment variables of the form IDB_X\n"
+        " will be passed through with the IDB_ prefix removed."
+    )
+    name = "run"
+
     def __init__(self) -> None:
         super().__init__()
         self._subcommands: List[Command] = [
@@ -330,16 +315,5 @@ class XctestRunCommand(CompositeCommand):
     def subcommands(self) -> List[Command]:
         return self._subcommands
 
-    @property
-    def description(self) -> str:
-        return (
-            "Run an installed xctest. Any environment variables of the form IDB_X\n"
-            " will be passed through with the IDB_ prefix removed."
-        )
-
-    @property
-    def name(self) -> str:
-        return "run"
-
     async def run_with_client(self, args: Namespace, client: IdbClient) -> None:
         await self.run(args)
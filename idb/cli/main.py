@@ -10,6 +10,7 @@ import concurrent.futures
 import logging
 import os
 import sys
+from operator import attrgetter
 from typing import List, Optional, Set
 
 import idb.common.plugin as plugin
@@ -260,7 +261,7 @@ async def gen_main(cmd_input: Optional[List[str]] = None) -> int:
     root_command = CommandGroup(
         name="root_command",
         description="",
-        commands=sorted(commands, key=lambda command: command.name),
+        commands=sorted(commands, key=attrgetter("name")),
     )
     root_command.add_parser_arguments(parser)
 
@@ -405,6 +405,17 @@ class TestParser(TestCase):
             container=bundle_id, src_path=src, dest_path=os.path.abspath(dst)
         )
 
+    async def test_file_show(self) -> None:
+        self.direct_client_mock.pull_stream = MagicMock(
+            return_value=AsyncGeneratorMock()
+        )
+        src = "Library/myFile.txt"
+        cmd_input = ["file", "show", src]
+        await cli_main(cmd_input=cmd_input)
+        self.direct_client_mock.pull_stream.assert_called_once_with(
+            container=None, src_path=src
+        )
+
     async def test_list_targets(self) -> None:
         self.management_client_mock().list_targets = AsyncMock(return_value=[])
         await cli_main(cmd_input=["list-targets"])
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# Copyright (c) Facebook, Inc. and its affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Sequence
+from unittest import mock
+
+from idb.cli.commands.video import _BatchedWriter, _writev_all
+from idb.utils.testing import TestCase, ignoreTaskLeaks
+
+
+def _chunks(count: int, size: int) -> List[bytes]:
+    return [bytes([index % 256]) * size for index in range(count)]
+
+
+class SlowReader(threading.Thread):
+    def __init__(self, fd: int) -> None:
+        super().__init__()
+        self.fd = fd
+        self.data = bytearray()
+
+    def run(self) -> None:
+        while True:
+            data = os.read(self.fd, 4096)
+            if not data:
+                return
+            self.data.extend(data)
+            time.sleep(0.0005)
+
+
+@ignoreTaskLeaks
+class VideoTests(TestCase):
+    def setUp(self) -> None:
+        (self.read_fd, self.write_fd) = os.pipe()
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    def tearDown(self) -> None:
+        self.executor.shutdown()
+        for fd in (self.read_fd, self.write_fd):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def writer(self) -> _BatchedWriter:
+        return _BatchedWriter(
+            fd=self.write_fd, loop=asyncio.get_event_loop(), executor=self.executor
+        )
+
+    async def write_to_slow_reader(self, chunks: Sequence[bytes]) -> bytes:
+        reader = SlowReader(fd=self.read_fd)
+        reader.start()
+        writer = self.writer()
+        for chunk in chunks:
+            await writer.write(chunk)
+        await writer.close()
+        os.close(self.write_fd)
+        reader.join()
+        return bytes(reader.data)
+
+    async def test_preserves_order_across_batches(self) -> None:
+        chunks = _chunks(count=512, size=3000)
+        with mock.patch(
+            "idb.cli.commands.video.os.writev", wraps=os.writev
+        ) as writev_mock:
+            data = await self.write_to_slow_reader(chunks)
+        self.assertEqual(data, b"".join(chunks))
+        # Chunks that arrived whilst the reader was behind were batched together
+        self.assertLess(writev_mock.call_count, len(chunks))
+
+    async def test_close_flushes_pending(self) -> None:
+        chunks = _chunks(count=8, size=100)
+        writer = self.writer()
+        for chunk in chunks:
+            await writer.write(chunk)
+        # The first chunk is in flight, the rest are waiting for it to finish
+        self.assertTrue(len(writer._pending))
+        await writer.close()
+        self.assertEqual(writer._pending, [])
+        os.close(self.write_fd)
+        self.assertEqual(os.read(self.read_fd, 4096), b"".join(chunks))
+
+    async def test_write_error_raised_from_write(self) -> None:
+        os.close(self.read_fd)
+        writer = self.writer()
+        await writer.write(b"first")
+        # pyre-ignore
+        await asyncio.wait([writer._write])
+        with self.assertRaises(BrokenPipeError):
+            await writer.write(b"second")
+
+    async def test_write_error_raised_from_close(self) -> None:
+        os.close(self.read_fd)
+        writer = self.writer()
+        await writer.write(b"first")
+        with self.assertRaises(BrokenPipeError):
+            await writer.close()
+
+    def test_writev_all_continues_partial_writes(self) -> None:
+        written = bytearray()
+
+        def writev(fd: int, buffers: Sequence[memoryview]) -> int:
+            # Write at most 5 bytes at a time, across buffer boundaries
+            data = b"".join(bytes(buffer) for buffer in buffers)[:5]
+            written.extend(data)
+            return len(data)
+
+        buffers = [b"abc", b"", b"defghijk", b"lmnopqrstuvwxyz"]
+        with mock.patch("idb.cli.commands.video.os.writev", side_effect=writev):
+            _writev_all(self.write_fd, buffers)
+        self.assertEqual(bytes(written), b"".join(buffers))
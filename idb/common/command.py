@@ -6,23 +6,50 @@
 
 from abc import ABCMeta, abstractmethod
 from argparse import ArgumentParser, Namespace
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+class _LazyArgumentParser(ArgumentParser):
+    # Defers adding arguments until the parser is used, so that only the
+    # arguments of the subcommand being invoked are constructed.
+    def __init__(
+        self,
+        *args: Any,  # pyre-ignore
+        populate: Optional[Callable[[ArgumentParser], None]] = None,
+        **kwargs: Any,  # pyre-ignore
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._populate = populate
+
+    def _ensure_populated(self) -> None:
+        populate = self._populate
+        if populate is None:
+            return
+        self._populate = None
+        populate(self)
+
+    def parse_known_args(  # pyre-ignore
+        self,
+        args: Optional[Sequence[str]] = None,
+        namespace: Optional[Namespace] = None,
+    ) -> Tuple[Namespace, List[str]]:
+        self._ensure_populated()
+        return super().parse_known_args(args, namespace)
+
+    def format_usage(self) -> str:
+        self._ensure_populated()
+        return super().format_usage()
+
+    def format_help(self) -> str:
+        self._ensure_populated()
+        return super().format_help()
 
 
 class Command(metaclass=ABCMeta):
-    @property
-    @abstractmethod
-    def description(self) -> str:
-        raise Exception("subclass")
-
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        raise Exception("subclass")
-
-    @property
-    def aliases(self) -> List[str]:
-        return []
+    # Subclasses provide these as class attributes
+    description: str
+    name: str
+    aliases: Sequence[str] = ()
 
     @abstractmethod
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
@@ -47,30 +74,37 @@ class CompositeCommand(Command, metaclass=ABCMeta):
     def subcommands(self) -> List[Command]:
         pass
 
-    @property
-    def subcommands_by_name(self) -> Dict[str, Command]:
-        def add_unique_cmd(key: str, value: Command) -> None:
+    def _index_subcommand(self, command: Command) -> None:
+        for key in (command.name, *command.aliases):
             assert (
                 key not in self._subcommands_by_name
             ), f'Subcommand by name "{key}" already exists'
-            self._subcommands_by_name[key] = value
+            self._subcommands_by_name[key] = command
 
+    @property
+    def subcommands_by_name(self) -> Dict[str, Command]:
         if len(self._subcommands_by_name) == 0:
             for cmd in self.subcommands:
-                add_unique_cmd(cmd.name, cmd)
-                for alias in cmd.aliases:
-                    add_unique_cmd(alias, cmd)
+                self._index_subcommand(cmd)
 
         return self._subcommands_by_name
 
     def add_parser_arguments(self, parser: ArgumentParser) -> None:
         self.parser = parser
-        sub_parsers = parser.add_subparsers(dest=self.name)
+        sub_parsers = parser.add_subparsers(
+            dest=self.name, parser_class=_LazyArgumentParser
+        )
+        # Index subcommands by name whilst registering them, so that resolving the
+        # invoked subcommand is a single lookup.
+        self._subcommands_by_name.clear()
         for command in self.subcommands:
-            sub_parser = sub_parsers.add_parser(
-                command.name, help=command.description, aliases=command.aliases
+            self._index_subcommand(command)
+            sub_parsers.add_parser(
+                command.name,
+                help=command.description,
+                aliases=command.aliases,
+                populate=command.add_parser_arguments,
             )
-            command.add_parser_arguments(sub_parser)
 
     def _get_subcommand_for_args(self, args: Namespace) -> Command:
         subcmd_name = getattr(args, self.name)
@@ -91,16 +125,8 @@ class CommandGroup(CompositeCommand):
     def __init__(self, name: str, description: str, commands: List[Command]) -> None:
         super().__init__()
         self.commands = commands
-        self._name = name
-        self._description = description
-
-    @property
-    def name(self) -> str:
-        return self._name
-
-    @property
-    def description(self) -> str:
-        return self._description
+        self.name = name
+        self.description = description
 
     @property
     def subcommands(self) -> List[Command]:
@@ -11,9 +11,19 @@ import subprocess
 from datetime import timedelta
 from logging import Logger
 from sys import platform
-from typing import AsyncGenerator, Dict, List, Optional, Sequence, Union
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-from idb.common.format import target_description_from_json
+from idb.common.format import json_loads, target_description_from_json
 from idb.common.logging import log_call
 from idb.common.types import (
     ECIDFilter,
@@ -29,6 +39,7 @@ from idb.utils.typing import none_throws
 DEFAULT_ERASE_COMMAND_TIMEOUT = timedelta(minutes=3)
 DEFAULT_COMPANION_COMMAND_TIMEOUT = timedelta(seconds=120)
 DEFAULT_COMPANION_TEARDOWN_TIMEOUT = timedelta(seconds=30)
+DEFAULT_COMPANION_KILL_TIMEOUT = timedelta(seconds=5)
 
 
 class IdbJsonException(Exception):
@@ -49,25 +60,57 @@ async def _terminate_process(
             process.wait(), timeout=timeout.total_seconds()
         )
         logger.info(f"Process has exited after SIGTERM with {returncode}")
-    except TimeoutError:
+    except asyncio.TimeoutError:
         logger.info(f"Process hasn't exited after {timeout}, SIGKILL'ing...")
         process.kill()
+        try:
+            # Reap the process so that it doesn't linger as a zombie.
+            returncode = await asyncio.wait_for(
+                process.wait(), timeout=DEFAULT_COMPANION_KILL_TIMEOUT.total_seconds()
+            )
+            logger.info(f"Process has exited after SIGKILL with {returncode}")
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Process hasn't exited after {DEFAULT_COMPANION_KILL_TIMEOUT}"
+            )
+
+
+def _close_stdout_pipe(process: asyncio.subprocess.Process) -> None:
+    # Closing our end of the pipe ends any pending read of stdout. There is no
+    # public API for this, so it relies on CPython's asyncio internals and does
+    # nothing when they aren't there.
+    transport = getattr(process, "_transport", None)
+    get_pipe_transport = getattr(transport, "get_pipe_transport", None)
+    if get_pipe_transport is None:
+        return
+    stdout_transport = get_pipe_transport(1)
+    if stdout_transport is not None:
+        stdout_transport.close()
+
+
+_ONLY_SIM: Tuple[str, ...] = ("--only", "simulator")
+_ONLY_DEV: Tuple[str, ...] = ("--only", "device")
+
+
+_ONLY_DISPATCH: Dict[type, Callable[[Any], Tuple[str, ...]]] = {
+    TargetType: lambda only: _ONLY_SIM if only is TargetType.SIMULATOR else _ONLY_DEV,
+    ECIDFilter: lambda only: ("--only", f"ecid:{only.ecid}"),
+}
 
 
-def _only_arg_from_filter(only: Optional[OnlyFilter]) -> List[str]:
-    if isinstance(only, TargetType):
-        return ["--only", "simulator" if only is TargetType.SIMULATOR else "device"]
-    elif isinstance(only, ECIDFilter):
-        return ["--only", f"ecid:{only.ecid}"]
-    return []
+def _only_arg_from_filter(only: Optional[OnlyFilter]) -> Tuple[str, ...]:
+    handler = _ONLY_DISPATCH.get(type(only))
+    return handler(only) if handler is not None else ()
 
 
 def parse_json_line(line: bytes) -> Dict[str, Union[int, str]]:
-    decoded_line = line.decode()
     try:
-        return json.loads(decoded_line)
+        return json_loads(line)
     except json.JSONDecodeError:
-        raise IdbJsonException(f"Failed to parse json from: {decoded_line}")
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+        raise IdbJsonException(
+            f"Failed to parse json from: {line.decode(errors='replace')}"
+        )
 
 
 class Companion:
@@ -77,29 +120,36 @@ class Companion:
         device_set_path: Optional[str],
         logger: Logger,
     ) -> None:
-        self._companion_path = companion_path
-        self._device_set_path = device_set_path
+        self._cmd_prefix: Optional[Tuple[str, ...]] = None
+        if companion_path is not None:
+            self._cmd_prefix = (
+                (companion_path,)
+                if device_set_path is None
+                else (companion_path, "--device-set-path", device_set_path)
+            )
         self._logger = logger
 
     @asynccontextmanager
     async def _start_companion_command(
-        self, arguments: List[str]
+        self, arguments: List[str], close_fds: bool = True
     ) -> AsyncGenerator[asyncio.subprocess.Process, None]:
-        companion_path = self._companion_path
-        if companion_path is None:
+        cmd_prefix = self._cmd_prefix
+        if cmd_prefix is None:
             if platform == "darwin":
                 raise IdbException("Companion path not provided")
             else:
                 raise IdbException(
                     "Companion interactions do not work on non-macOS platforms"
                 )
-        cmd: List[str] = [companion_path]
-        device_set_path = self._device_set_path
-        if device_set_path is not None:
-            cmd.extend(["--device-set-path", device_set_path])
-        cmd.extend(arguments)
+        # Without close_fds, subprocess can use posix_spawn instead of fork on macOS.
+        # Inheritable descriptors that idb itself inherited are then passed on, so
+        # it is only turned off for short lived commands, not persistent companions.
         process = await asyncio.create_subprocess_exec(
-            *cmd, stdout=subprocess.PIPE, stderr=None
+            *cmd_prefix,
+            *arguments,
+            stdout=subprocess.PIPE,
+            stderr=None,
+            close_fds=close_fds,
         )
         logger = self._logger.getChild(f"{process.pid}:{' '.join(arguments)}")
         logger.info("Launched process")
@@ -114,9 +164,11 @@ class Companion:
 
     async def _run_companion_command(
         self, arguments: List[str], timeout: Optional[timedelta]
-    ) -> str:
+    ) -> bytes:
         timeout = timeout if timeout is not None else DEFAULT_COMPANION_COMMAND_TIMEOUT
-        async with self._start_companion_command(arguments=arguments) as process:
+        async with self._start_companion_command(
+            arguments=arguments, close_fds=False
+        ) as process:
             try:
                 (output, _) = await asyncio.wait_for(
                     process.communicate(), timeout=timeout.total_seconds()
@@ -124,19 +176,68 @@ class Companion:
                 if process.returncode != 0:
                     raise IdbException(f"Failed to run {arguments}")
                 self._logger.info(f"Ran {arguments} successfully.")
-                return output.decode()
+                return output
             except asyncio.TimeoutError:
                 raise IdbException(
                     f"Timed out after {timeout} secs on command {' '.join(arguments)}"
                 )
 
+    async def _stream_companion_command(
+        self, arguments: List[str], timeout: Optional[timedelta]
+    ) -> AsyncGenerator[bytes, None]:
+        timeout = timeout if timeout is not None else DEFAULT_COMPANION_COMMAND_TIMEOUT
+        async with self._start_companion_command(
+            arguments=arguments, close_fds=False
+        ) as process:
+            timed_out = False
+
+            def kill() -> None:
+                nonlocal timed_out
+                timed_out = True
+                if process.returncode is None:
+                    process.kill()
+                # A descendant of the companion may still hold stdout open.
+                _close_stdout_pipe(process=process)
+
+            # A single timer enforces the deadline, without wrapping every read in a
+            # task.
+            timer = asyncio.get_event_loop().call_later(timeout.total_seconds(), kill)
+            try:
+                async for line in none_throws(process.stdout):
+                    yield line
+                returncode = await process.wait()
+            finally:
+                timer.cancel()
+            if timed_out:
+                raise IdbException(
+                    f"Timed out after {timeout} secs on command {' '.join(arguments)}"
+                )
+            if returncode != 0:
+                raise IdbException(f"Failed to run {arguments}")
+            self._logger.info(f"Ran {arguments} successfully.")
+
+    async def _run_companion_command_last_line(
+        self, arguments: List[str], timeout: Optional[timedelta]
+    ) -> bytes:
+        last_line = b""
+        lines = self._stream_companion_command(arguments=arguments, timeout=timeout)
+        try:
+            async for line in lines:
+                if len(line.strip()):
+                    last_line = line
+        finally:
+            await lines.aclose()
+        if not len(last_line):
+            raise IdbException(f"No output from {arguments}")
+        return last_line
+
     async def _run_udid_command(
         self,
         udid: str,
         command: str,
         timeout: Optional[timedelta],
         extra_arguments: Optional[Sequence[str]] = None,
-    ) -> str:
+    ) -> bytes:
         arguments = [f"--{command}", udid]
         if extra_arguments is not None:
             arguments.extend(extra_arguments)
@@ -148,10 +249,10 @@ class Companion:
     async def create(
         self, device_type: str, os_version: str, timeout: Optional[timedelta] = None
     ) -> TargetDescription:
-        output = await self._run_companion_command(
+        line = await self._run_companion_command_last_line(
             arguments=["--create", f"{device_type},{os_version}"], timeout=timeout
         )
-        return target_description_from_json(output.splitlines()[-1])
+        return target_description_from_json(line)
 
     @log_call()
     async def boot(
@@ -205,8 +306,10 @@ class Companion:
         arguments = ["--clone", udid]
         if destination_device_set is not None:
             arguments.extend(["--clone-destination-set", destination_device_set])
-        output = await self._run_companion_command(arguments=arguments, timeout=timeout)
-        return target_description_from_json(output.splitlines()[-1])
+        line = await self._run_companion_command_last_line(
+            arguments=arguments, timeout=timeout
+        )
+        return target_description_from_json(line)
 
     @log_call()
     async def delete(
@@ -216,17 +319,32 @@ class Companion:
             udid=udid if udid is not None else "all", command="delete", timeout=timeout
         )
 
+    async def _list_targets(
+        self,
+        only: Optional[OnlyFilter],
+        udid: Optional[str],
+        timeout: Optional[timedelta],
+    ) -> List[TargetDescription]:
+        arguments = ["--list", "1", *_only_arg_from_filter(only=only)]
+        # When looking for a udid, only parse the lines that can contain it.
+        udid_bytes = udid.encode() if udid is not None else None
+        lines = self._stream_companion_command(arguments=arguments, timeout=timeout)
+        try:
+            return [
+                target_description_from_json(data=line)
+                async for line in lines
+                if len(line.strip()) and (udid_bytes is None or udid_bytes in line)
+            ]
+        finally:
+            # Stops the companion straight away if parsing fails, rather than when
+            # the generator is garbage collected.
+            await lines.aclose()
+
     @log_call()
     async def list_targets(
         self, only: Optional[OnlyFilter] = None, timeout: Optional[timedelta] = None
     ) -> List[TargetDescription]:
-        arguments = ["--list", "1"] + _only_arg_from_filter(only=only)
-        output = await self._run_companion_command(arguments=arguments, timeout=timeout)
-        return [
-            target_description_from_json(data=line.strip())
-            for line in output.splitlines()
-            if len(line.strip())
-        ]
+        return await self._list_targets(only=only, udid=None, timeout=timeout)
 
     @log_call()
     async def target_description(
@@ -235,14 +353,17 @@ class Companion:
         only: Optional[OnlyFilter] = None,
         timeout: Optional[timedelta] = None,
     ) -> TargetDescription:
-        all_details = await self.list_targets(only=only, timeout=timeout)
-        details = all_details
+        details = await self._list_targets(only=only, udid=udid, timeout=timeout)
         if udid is not None:
-            details = [target for target in all_details if target.udid == udid]
+            details = [target for target in details if target.udid == udid]
         if len(details) > 1:
             raise IdbException(f"More than one device info found {details}")
         if len(details) == 0:
-            raise IdbException(f"No device info found, got {all_details}")
+            raise IdbException(
+                f"No device info found for {udid}"
+                if udid is not None
+                else f"No device info found, got {details}"
+            )
         return details[0]
 
     @asynccontextmanager
@@ -250,8 +371,13 @@ class Companion:
         self, udid: str, path: str, only: Optional[OnlyFilter] = None
     ) -> AsyncGenerator[str, None]:
         async with self._start_companion_command(
-            ["--udid", udid, "--grpc-domain-sock", path]
-            + _only_arg_from_filter(only=only)
+            [
+                "--udid",
+                udid,
+                "--grpc-domain-sock",
+                path,
+                *_only_arg_from_filter(only=only),
+            ]
         ) as process:
             line = await none_throws(process.stdout).readline()
             output = parse_json_line(line)
@@ -4,11 +4,17 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
-from typing import AsyncIterator
+import asyncio
+import threading
+from typing import AsyncIterator, Optional
 
 import aiofiles
 
 
+FILE_READ_CHUNK_SIZE: int = 1024 * 1024
+FILE_READ_AHEAD_CHUNKS: int = 4
+
+
 def get_last_n_lines(file_path: str, n: int) -> str:
     with open(file_path, "r") as f:
         return "\n".join(f.readlines()[-n:])
@@ -18,3 +24,41 @@ async def drain_to_file(stream: AsyncIterator[bytes], file_path: str) -> None:
     async with aiofiles.open(file_path, "w+b") as f:
         async for data in stream:
             await f.write(data)
+
+
+async def generate_file(file_path: str) -> AsyncIterator[bytes]:
+    # The whole file is read in a single executor call, rather than one per chunk.
+    # The reader stays at most a few chunks ahead, so that memory is bounded.
+    loop = asyncio.get_event_loop()
+    chunks: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue()
+    slots = threading.Semaphore(FILE_READ_AHEAD_CHUNKS)
+    stopped = threading.Event()
+
+    def read() -> None:
+        try:
+            with open(file_path, "rb") as f:
+                while True:
+                    slots.acquire()
+                    if stopped.is_set():
+                        return
+                    data = f.read(FILE_READ_CHUNK_SIZE)
+                    if not data:
+                        return
+                    loop.call_soon_threadsafe(chunks.put_nowait, data)
+        finally:
+            loop.call_soon_threadsafe(chunks.put_nowait, None)
+
+    reading = loop.run_in_executor(None, read)
+    try:
+        while True:
+            data = await chunks.get()
+            if data is None:
+                break
+            slots.release()
+            yield data
+        # Raises any error from opening or reading the file
+        await reading
+    finally:
+        # Lets the reader exit if the consumer stopped early
+        stopped.set()
+        slots.release()
@@ -24,6 +24,13 @@ from idb.common.types import (
 from treelib import Tree
 
 
+try:
+    # orjson is optional, and parses bytes directly and much faster when available.
+    from orjson import loads as json_loads  # pyre-ignore
+except ImportError:
+    from json import loads as json_loads
+
+
 def human_format_test_info(test: TestRunInfo) -> str:
     output = ""
 
@@ -243,8 +250,8 @@ def json_to_companion_info(data: List[Dict[str, Any]]) -> List[CompanionInfo]:
     ]
 
 
-def target_description_from_json(data: str) -> TargetDescription:
-    return target_description_from_dictionary(parsed=json.loads(data))
+def target_description_from_json(data: Union[str, bytes]) -> TargetDescription:
+    return target_description_from_dictionary(parsed=json_loads(data))
 
 
 def target_description_from_dictionary(parsed: Dict[str, Any]) -> TargetDescription:
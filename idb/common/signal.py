@@ -23,7 +23,7 @@ def signal_handler_event(name: str) -> asyncio.Event:
         stop.set()
 
     for sig in _SIGNALS:
-        loop.add_signal_handler(sig, lambda: signal_handler(sig))
+        loop.add_signal_handler(sig, signal_handler, sig)
 
     print(f"Running {name} until ^C", file=stderr)
     return stop
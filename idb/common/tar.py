@@ -25,6 +25,7 @@ def _has_executable(exe: str) -> bool:
 
 COMPRESSION_COMMAND = ["pigz", "-c"] if _has_executable("pigz") else ["gzip", "-4"]
 READ_CHUNK_SIZE: int = 1024 * 1024 * 4  # 4Mb, the default max read for gRPC
+DRAIN_ERROR_TIMEOUT: float = 1.0
 
 
 async def is_gnu_tar() -> bool:
@@ -86,6 +87,14 @@ def _create_untar_command(
     return command
 
 
+def _create_untar_to_stdout_command(gnu_tar: bool) -> List[str]:
+    command = ["tar"]
+    if gnu_tar:
+        command.append("--warning=no-unknown-keyword")
+    command.extend(["-xzOf", "-"])
+    return command
+
+
 async def _generator_from_data(data: bytes) -> AsyncIterator[bytes]:
     yield data
 
@@ -162,6 +171,67 @@ async def drain_untar(
     await process.wait()
 
 
+async def generate_untar(generator: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *_create_untar_to_stdout_command(gnu_tar=await is_gnu_tar()),
+            stdin=asyncio.subprocess.PIPE,
+            stderr=sys.stderr,
+            stdout=asyncio.subprocess.PIPE,
+        )
+    except OSError as e:
+        raise TarException(f"Failed to start tar: {e}") from e
+
+    async def drain_to_stdin() -> None:
+        writer = none_throws(process.stdin)
+        try:
+            async for data in generator:
+                writer.write(data)
+                await writer.drain()
+            writer.write_eof()
+            await writer.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            # tar has stopped reading, its exit code says why
+            pass
+        finally:
+            # Closing stdin on failure lets tar exit, rather than wait for more input
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+    drain = asyncio.ensure_future(drain_to_stdin())
+    try:
+        reader = none_throws(process.stdout)
+        while not reader.at_eof():
+            data = await reader.read(READ_CHUNK_SIZE)
+            if not data:
+                break
+            yield data
+        returncode = await process.wait()
+        if returncode != 0:
+            # A failing input, such as a gRPC error, truncates tar's input, so report
+            # that rather than tar's exit code.
+            await asyncio.wait([drain], timeout=DRAIN_ERROR_TIMEOUT)
+            drain_error = (
+                drain.exception() if drain.done() and not drain.cancelled() else None
+            )
+            if drain_error is not None:
+                raise drain_error
+            raise TarException(
+                "Failed to extract tar file, "
+                f"tar command exited with non-zero exit code {returncode}"
+            )
+        await drain
+    finally:
+        drain.cancel()
+        # The consumer may stop early, don't leave tar behind unreaped
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+
+
 async def untar(data: bytes, output_path: str, verbose: bool = False) -> None:
     await drain_untar(
         generator=_generator_from_data(data=data),
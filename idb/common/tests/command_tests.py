@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# Copyright (c) Facebook, Inc. and its affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+from argparse import ArgumentParser, Namespace
+from typing import List
+
+from idb.common.command import Command, CommandGroup
+from idb.utils.testing import TestCase
+
+
+class RecordingCommand(Command):
+    description = "A command that records how it was set up"
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.populated = False
+
+    def add_parser_arguments(self, parser: ArgumentParser) -> None:
+        self.populated = True
+        parser.add_argument("--value", default=None)
+
+    async def run(self, args: Namespace) -> None:
+        pass
+
+
+class CommandTests(TestCase):
+    def build_parser(self, commands: List[Command]) -> ArgumentParser:
+        parser = ArgumentParser()
+        CommandGroup(
+            name="root_command", description="", commands=commands
+        ).add_parser_arguments(parser)
+        return parser
+
+    def test_only_invoked_subcommand_is_populated(self) -> None:
+        first = RecordingCommand("first")
+        second = RecordingCommand("second")
+        parser = self.build_parser([first, second])
+        self.assertFalse(first.populated)
+        self.assertFalse(second.populated)
+        args = parser.parse_args(["second", "--value", "foo"])
+        self.assertEqual(args.root_command, "second")
+        self.assertEqual(args.value, "foo")
+        self.assertFalse(first.populated)
+        self.assertTrue(second.populated)
+
+    def test_nested_group_is_populated(self) -> None:
+        inner = RecordingCommand("inner")
+        other = RecordingCommand("other")
+        parser = self.build_parser(
+            [
+                CommandGroup(name="group", description="", commands=[inner]),
+                other,
+            ]
+        )
+        args = parser.parse_args(["group", "inner", "--value", "foo"])
+        self.assertEqual(args.group, "inner")
+        self.assertEqual(args.value, "foo")
+        self.assertTrue(inner.populated)
+        self.assertFalse(other.populated)
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# Copyright (c) Facebook, Inc. and its affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+import asyncio
+import json
+from datetime import timedelta
+from typing import List, Optional, Tuple
+from unittest import mock
+
+from idb.common.companion import Companion, _terminate_process
+from idb.common.types import IdbException, TargetType
+from idb.utils.testing import AsyncMock, TestCase, ignoreTaskLeaks
+
+
+FIRST_UDID = "0B3311FA-234C-4665-950F-37544F690B61"
+SECOND_UDID = "5A9CB1D5-7F5C-4B4B-8E0A-3B1F6D0C2E11"
+
+
+def _target_json(udid: str, name: str) -> str:
+    return json.dumps(
+        {"udid": udid, "name": name, "state": "Booted", "type": "simulator"}
+    )
+
+
+class FakeProcess:
+    def __init__(self, output: bytes, returncode: int = 0, hang: bool = False) -> None:
+        self.pid = 1234
+        self.returncode: Optional[int] = None if hang else returncode
+        self.stdout = asyncio.StreamReader()
+        self.stdout.feed_data(output)
+        if not hang:
+            self.stdout.feed_eof()
+        # Closing the stdout pipe transport ends the reader, as it does in asyncio
+        self._transport = mock.Mock()
+        pipe_transport = self._transport.get_pipe_transport.return_value
+        pipe_transport.close.side_effect = self.stdout.feed_eof
+
+    async def communicate(self) -> Tuple[bytes, None]:
+        return (await self.stdout.read(), None)
+
+    async def wait(self) -> Optional[int]:
+        return self.returncode
+
+    def kill(self) -> None:
+        # stdout stays open, as if a descendant of the process still held it
+        self.returncode = -9
+
+
+class StubbornProcess:
+    def __init__(self) -> None:
+        self.returncode: Optional[int] = None
+        self.exited = asyncio.Event()
+        self.terminate = mock.Mock()
+
+    async def wait(self) -> Optional[int]:
+        await self.exited.wait()
+        return self.returncode
+
+    def kill(self) -> None:
+        self.returncode = -9
+        self.exited.set()
+
+
+@ignoreTaskLeaks
+class CompanionTests(TestCase):
+    def setUp(self) -> None:
+        self.companion = Companion(
+            companion_path="idb_companion", device_set_path=None, logger=mock.Mock()
+        )
+
+    def patch_output(
+        self, lines: List[str], returncode: int = 0, hang: bool = False
+    ) -> mock.Mock:
+        output = "".join(f"{line}\n" for line in lines).encode()
+        return mock.patch(
+            "idb.common.companion.asyncio.create_subprocess_exec",
+            new=AsyncMock(
+                return_value=FakeProcess(output, returncode=returncode, hang=hang)
+            ),
+        )
+
+    async def test_list_targets(self) -> None:
+        with self.patch_output(
+            [_target_json(FIRST_UDID, "first"), "", _target_json(SECOND_UDID, "second")]
+        ) as exec_mock:
+            targets = await self.companion.list_targets()
+            exec_mock.assert_called_once_with(
+                "idb_companion",
+                "--list",
+                "1",
+                stdout=mock.ANY,
+                stderr=None,
+                close_fds=False,
+            )
+        self.assertEqual([target.udid for target in targets], [FIRST_UDID, SECOND_UDID])
+
+    async def test_list_targets_with_device_set_and_only(self) -> None:
+        companion = Companion(
+            companion_path="idb_companion",
+            device_set_path="/tmp/devices",
+            logger=mock.Mock(),
+        )
+        with self.patch_output([_target_json(FIRST_UDID, "first")]) as exec_mock:
+            await companion.list_targets(only=TargetType.SIMULATOR)
+            exec_mock.assert_called_once_with(
+                "idb_companion",
+                "--device-set-path",
+                "/tmp/devices",
+                "--list",
+                "1",
+                "--only",
+                "simulator",
+                stdout=mock.ANY,
+                stderr=None,
+                close_fds=False,
+            )
+
+    async def test_list_targets_failure(self) -> None:
+        with self.patch_output([_target_json(FIRST_UDID, "first")], returncode=1):
+            with self.assertRaises(IdbException):
+                await self.companion.list_targets()
+
+    async def test_list_targets_timeout(self) -> None:
+        with self.patch_output([_target_json(FIRST_UDID, "first")], hang=True):
+            with self.assertRaisesRegex(IdbException, "Timed out"):
+                await asyncio.wait_for(
+                    self.companion.list_targets(timeout=timedelta(seconds=0.01)),
+                    timeout=3,
+                )
+
+    async def test_list_targets_timeout_without_transport(self) -> None:
+        process = FakeProcess(
+            output=f"{_target_json(FIRST_UDID, 'first')}\n".encode(), hang=True
+        )
+        # Without asyncio's internals, killing the process is what ends stdout
+        del process._transport
+
+        def kill() -> None:
+            process.returncode = -9
+            process.stdout.feed_eof()
+
+        process.kill = mock.Mock(side_effect=kill)
+        with mock.patch(
+            "idb.common.companion.asyncio.create_subprocess_exec",
+            new=AsyncMock(return_value=process),
+        ):
+            with self.assertRaisesRegex(IdbException, "Timed out"):
+                await asyncio.wait_for(
+                    self.companion.list_targets(timeout=timedelta(seconds=0.01)),
+                    timeout=3,
+                )
+        process.kill.assert_called_once_with()
+
+    async def test_stream_timeout_with_stdout_held_by_descendant(self) -> None:
+        companion = Companion(
+            companion_path="/bin/sh", device_set_path=None, logger=mock.Mock()
+        )
+        lines: List[bytes] = []
+
+        async def stream() -> None:
+            async for line in companion._stream_companion_command(
+                arguments=["-c", "sleep 5 & echo line; wait"],
+                timeout=timedelta(seconds=0.2),
+            ):
+                lines.append(line)
+
+        with self.assertRaisesRegex(IdbException, "Timed out"):
+            await asyncio.wait_for(stream(), timeout=3)
+        self.assertEqual(lines, [b"line\n"])
+
+    async def test_list_targets_bad_line_stops_companion(self) -> None:
+        with self.patch_output(
+            [_target_json(FIRST_UDID, "first"), "not json"]
+        ), mock.patch(
+            "idb.common.companion._terminate_process", new=AsyncMock()
+        ) as terminate_mock:
+            with self.assertRaises(ValueError):
+                await self.companion.list_targets()
+            terminate_mock.assert_called_once()
+
+    async def test_unix_domain_server_closes_fds(self) -> None:
+        output = json.dumps({"grpc_path": "/tmp/idb.sock"})
+        with self.patch_output([output]) as exec_mock:
+            async with self.companion.unix_domain_server(
+                udid=FIRST_UDID, path="/tmp/idb.sock"
+            ) as grpc_path:
+                self.assertEqual(grpc_path, "/tmp/idb.sock")
+            exec_mock.assert_called_once_with(
+                "idb_companion",
+                "--udid",
+                FIRST_UDID,
+                "--grpc-domain-sock",
+                "/tmp/idb.sock",
+                stdout=mock.ANY,
+                stderr=None,
+                close_fds=True,
+            )
+
+    async def test_target_description_by_udid(self) -> None:
+        with self.patch_output(
+            [_target_json(FIRST_UDID, "first"), _target_json(SECOND_UDID, "second")]
+        ):
+            target = await self.companion.target_description(udid=SECOND_UDID)
+        self.assertEqual(target.udid, SECOND_UDID)
+        self.assertEqual(target.name, "second")
+
+    async def test_target_description_missing_udid(self) -> None:
+        with self.patch_output([_target_json(FIRST_UDID, "first")]):
+            with self.assertRaises(IdbException):
+                await self.companion.target_description(udid=SECOND_UDID)
+
+    async def test_target_description_ambiguous(self) -> None:
+        with self.patch_output(
+            [_target_json(FIRST_UDID, "first"), _target_json(SECOND_UDID, "second")]
+        ):
+            with self.assertRaises(IdbException):
+                await self.companion.target_description()
+
+    async def test_create_parses_last_line(self) -> None:
+        with self.patch_output(
+            ["Creating iPhone 11 on iOS 14.0", _target_json(FIRST_UDID, "first"), ""]
+        ):
+            target = await self.companion.create(
+                device_type="iPhone 11", os_version="iOS 14.0"
+            )
+        self.assertEqual(target.udid, FIRST_UDID)
+
+    async def test_clone_without_output(self) -> None:
+        with self.patch_output([""]):
+            with self.assertRaisesRegex(IdbException, "No output"):
+                await self.companion.clone(udid=FIRST_UDID)
+
+    async def test_terminate_process_kills_and_reaps(self) -> None:
+        process = StubbornProcess()
+        await _terminate_process(
+            # pyre-ignore
+            process=process,
+            timeout=timedelta(seconds=0.01),
+            logger=mock.Mock(),
+        )
+        process.terminate.assert_called_once_with()
+        self.assertEqual(process.returncode, -9)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# Copyright (c) Facebook, Inc. and its affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+import os
+import tempfile
+from typing import List
+from unittest import mock
+
+from idb.common.file import generate_file
+from idb.utils.testing import TestCase
+
+
+class FileTests(TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "file.bin")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    async def test_generate_file(self) -> None:
+        contents = bytes(range(256)) * 1024
+        with open(self.file_path, "wb") as f:
+            f.write(contents)
+        chunks: List[bytes] = []
+        with mock.patch("idb.common.file.FILE_READ_CHUNK_SIZE", 1000):
+            async for data in generate_file(self.file_path):
+                chunks.append(data)
+        self.assertEqual(b"".join(chunks), contents)
+        self.assertEqual(len(chunks), 263)
+
+    async def test_generate_file_missing(self) -> None:
+        with self.assertRaises(FileNotFoundError):
+            async for _ in generate_file(self.file_path):
+                pass
+
+    async def test_generate_file_closed_early(self) -> None:
+        with open(self.file_path, "wb") as f:
+            f.write(bytes(1024 * 1024))
+        with mock.patch("idb.common.file.FILE_READ_CHUNK_SIZE", 1000):
+            generator = generate_file(self.file_path)
+            # pyre-ignore
+            self.assertEqual(await generator.__anext__(), bytes(1000))
+            # pyre-ignore
+            await generator.aclose()
@@ -4,10 +4,42 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
-from idb.common.tar import _create_untar_command
+import asyncio
+import io
+import tarfile
+from typing import Any, AsyncIterator, List
+from unittest import mock
+
+from idb.common.tar import (
+    TarException,
+    _create_untar_command,
+    _create_untar_to_stdout_command,
+    generate_untar,
+)
 from idb.utils.testing import TestCase
 
 
+def _gzipped_tar(name: str, contents: bytes) -> bytes:
+    output = io.BytesIO()
+    with tarfile.open(fileobj=output, mode="w:gz") as tar:
+        info = tarfile.TarInfo(name=name)
+        info.size = len(contents)
+        tar.addfile(info, io.BytesIO(contents))
+    return output.getvalue()
+
+
+async def _chunks(data: bytes, size: int = 1024) -> AsyncIterator[bytes]:
+    for index in range(0, len(data), size):
+        yield data[index : index + size]
+
+
+async def _collect(generator: AsyncIterator[bytes]) -> bytes:
+    chunks: List[bytes] = []
+    async for chunk in generator:
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
 class UdidTests(TestCase):
     def test_untar_command_gnu(self) -> None:
         output_path = "test_output_path"
@@ -32,3 +64,60 @@ class UdidTests(TestCase):
             _create_untar_command(output_path=output_path, gnu_tar=False, verbose=True),
             ["tar", "-C", output_path, "-xzpfv", "-"],
         )
+
+    def test_untar_to_stdout_command(self) -> None:
+        self.assertEqual(
+            _create_untar_to_stdout_command(gnu_tar=True),
+            ["tar", "--warning=no-unknown-keyword", "-xzOf", "-"],
+        )
+        self.assertEqual(
+            _create_untar_to_stdout_command(gnu_tar=False), ["tar", "-xzOf", "-"]
+        )
+
+    async def test_generate_untar(self) -> None:
+        contents = bytes(range(256)) * 4096
+        data = _gzipped_tar(name="file.bin", contents=contents)
+        self.assertEqual(await _collect(generate_untar(_chunks(data))), contents)
+
+    async def test_generate_untar_corrupt(self) -> None:
+        data = b"this is not a gzipped tarball" * 1024 * 1024
+        with self.assertRaises(TarException):
+            await _collect(generate_untar(_chunks(data)))
+
+    async def test_generate_untar_input_error(self) -> None:
+        data = _gzipped_tar(name="file.bin", contents=bytes(range(256)) * 4096)
+
+        async def failing_input() -> AsyncIterator[bytes]:
+            yield data[: len(data) // 2]
+            raise ValueError("input failed")
+
+        with self.assertRaisesRegex(ValueError, "input failed"):
+            await _collect(generate_untar(failing_input()))
+
+    async def test_generate_untar_missing_tar(self) -> None:
+        with mock.patch(
+            "idb.common.tar.asyncio.create_subprocess_exec",
+            side_effect=FileNotFoundError("tar"),
+        ):
+            with self.assertRaises(TarException):
+                await _collect(generate_untar(_chunks(b"")))
+
+    async def test_generate_untar_closed_early(self) -> None:
+        contents = bytes(range(256)) * 65536
+        data = _gzipped_tar(name="file.bin", contents=contents)
+        processes: List[asyncio.subprocess.Process] = []
+        create_subprocess_exec = asyncio.create_subprocess_exec
+
+        async def spawn(*args: Any, **kwargs: Any) -> asyncio.subprocess.Process:
+            process = await create_subprocess_exec(*args, **kwargs)
+            processes.append(process)
+            return process
+
+        with mock.patch("idb.common.tar.asyncio.create_subprocess_exec", new=spawn):
+            generator = generate_untar(_chunks(data))
+            # pyre-ignore
+            self.assertTrue(len(await generator.__anext__()))
+            # pyre-ignore
+            await generator.aclose()
+        self.assertEqual(len(processes), 1)
+        self.assertIsNotNone(processes[0].returncode)
@@ -579,6 +579,12 @@ class IdbClient(ABC):
     ) -> None:
         pass
 
+    @abstractmethod
+    async def pull_stream(
+        self, container: FileContainer, src_path: str
+    ) -> AsyncIterator[bytes]:
+        yield
+
     @abstractmethod
     async def push(
         self, src_paths: List[str], container: FileContainer, dest_path: str
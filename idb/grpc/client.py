@@ -32,7 +32,7 @@ from grpclib.client import Channel
 from grpclib.exceptions import GRPCError, ProtocolError, StreamTerminatedError
 from idb.common.companion import Companion
 from idb.common.constants import TESTS_POLL_INTERVAL
-from idb.common.file import drain_to_file
+from idb.common.file import drain_to_file, generate_file
 from idb.common.gzip import drain_gzip_decompress
 from idb.common.hid import (
     button_press_to_events,
@@ -44,7 +44,7 @@ from idb.common.hid import (
 )
 from idb.common.logging import log_call
 from idb.common.stream import stream_map
-from idb.common.tar import create_tar, drain_untar, generate_tar
+from idb.common.tar import create_tar, drain_untar, generate_tar, generate_untar
 from idb.common.types import (
     AccessibilityInfo,
     Address,
@@ -634,6 +634,43 @@ class IdbClient(IdbClientBase):
                 await drain_untar(generate_bytes(stream), output_path=dest_path)
             self.logger.info(f"pulled file to {dest_path}")
 
+    @log_and_handle_exceptions
+    async def pull_stream(
+        self, container: FileContainer, src_path: str
+    ) -> AsyncIterator[bytes]:
+        if self.is_local:
+            # A local companion writes the file straight to disk, which is cheaper
+            # than compressing it, streaming it and extracting it again.
+            with tempfile.TemporaryDirectory() as destination_directory:
+                destination_directory = os.path.abspath(destination_directory)
+                await self.pull(
+                    container=container,
+                    src_path=src_path,
+                    dest_path=destination_directory,
+                )
+                file_path = os.path.join(
+                    destination_directory, os.path.basename(src_path)
+                )
+                try:
+                    async for data in generate_file(file_path):
+                        yield data
+                except OSError as e:
+                    # Not a connection problem, so don't let it be reported as one
+                    raise IdbException(f"Failed to read pulled file {file_path}: {e}")
+        else:
+            async with self.stub.pull.open() as stream:
+                # Without a destination the companion streams back a tarball.
+                await stream.send_message(
+                    PullRequest(
+                        bundle_id=file_container_to_bundle_id_deprecated(container),
+                        src_path=src_path,
+                        container=file_container_to_grpc(container),
+                    )
+                )
+                await stream.end()
+                async for data in generate_untar(generate_bytes(stream)):
+                    yield data
+
     @log_and_handle_exceptions
     async def list_test_bundle(self, test_bundle_id: str, app_path: str) -> List[str]:
         response = await self.stub.xctest_list_tests(
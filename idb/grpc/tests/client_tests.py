@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# Copyright (c) Facebook, Inc. and its affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+import io
+import os
+import tarfile
+from typing import Any, AsyncIterator, List, Optional
+from unittest import mock
+
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError
+from idb.common.types import CompanionInfo, IdbException, TCPAddress
+from idb.grpc.client import IdbClient
+from idb.grpc.idb_pb2 import Payload, PullResponse
+from idb.utils.testing import AsyncMock, TestCase
+
+
+def _gzipped_tar(name: str, contents: bytes) -> bytes:
+    output = io.BytesIO()
+    with tarfile.open(fileobj=output, mode="w:gz") as tar:
+        info = tarfile.TarInfo(name=name)
+        info.size = len(contents)
+        tar.addfile(info, io.BytesIO(contents))
+    return output.getvalue()
+
+
+class FakePullStream:
+    def __init__(self, data: bytes, error: Optional[GRPCError] = None) -> None:
+        self.data = data
+        self.error = error
+        self.send_message = AsyncMock()
+        self.end = AsyncMock()
+
+    async def __aenter__(self) -> "FakePullStream":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+    async def __aiter__(self) -> AsyncIterator[PullResponse]:
+        for index in range(0, len(self.data), 1024):
+            yield PullResponse(payload=Payload(data=self.data[index : index + 1024]))
+        if self.error is not None:
+            raise self.error
+
+
+async def _collect(generator: AsyncIterator[bytes]) -> bytes:
+    chunks: List[bytes] = []
+    async for chunk in generator:
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+class ClientTests(TestCase):
+    def client(self, is_local: bool) -> IdbClient:
+        return IdbClient(
+            stub=mock.Mock(),
+            companion=CompanionInfo(
+                udid="udid",
+                is_local=is_local,
+                address=TCPAddress(host="localhost", port=10882),
+            ),
+            logger=mock.Mock(),
+        )
+
+    async def test_pull_stream_local_reads_pulled_file(self) -> None:
+        contents = b"file contents" * 1024
+
+        def pull(container: None, src_path: str, dest_path: str) -> None:
+            with open(os.path.join(dest_path, os.path.basename(src_path)), "wb") as f:
+                f.write(contents)
+
+        client = self.client(is_local=True)
+        with mock.patch.object(client, "pull", new=AsyncMock(side_effect=pull)):
+            chunks: List[bytes] = []
+            async for data in client.pull_stream(
+                container=None, src_path="Library/myFile.txt"
+            ):
+                chunks.append(data)
+        self.assertEqual(b"".join(chunks), contents)
+        client.stub.pull.open.assert_not_called()
+
+    async def test_pull_stream_remote_extracts_tarball(self) -> None:
+        contents = bytes(range(256)) * 4096
+        client = self.client(is_local=False)
+        client.stub.pull.open.return_value = FakePullStream(
+            data=_gzipped_tar(name="myFile.txt", contents=contents)
+        )
+        data = await _collect(
+            client.pull_stream(container=None, src_path="Library/myFile.txt")
+        )
+        self.assertEqual(data, contents)
+
+    async def test_pull_stream_remote_error(self) -> None:
+        data = _gzipped_tar(name="myFile.txt", contents=bytes(range(256)) * 4096)
+        client = self.client(is_local=False)
+        client.stub.pull.open.return_value = FakePullStream(
+            data=data[: len(data) // 2],
+            error=GRPCError(Status.NOT_FOUND, "No such file"),
+        )
+        with self.assertRaisesRegex(IdbException, "No such file"):
+            await _collect(
+                client.pull_stream(container=None, src_path="Library/myFile.txt")
+            )